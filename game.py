@@ -14,18 +14,24 @@
 import os
 # vector math
 import math
-# timestamp management
+# frame timing
 import time
 # random generation
 import random
 # error handling
 import traceback
+# tracebacks for hard crashes (eg. segfaults in native code)
+import faulthandler
 # hide pesky warnings
 import warnings
 # sane console logging
 import logging
 # open links
 import webbrowser
+# fast attribute lookups for sorting
+from operator import attrgetter
+# memoization
+from functools import lru_cache
 
 # don't change this
 VERSION = '1.0'
@@ -34,6 +40,8 @@ VERSION = '1.0'
 USE_ADVANCED_LOGGING = True
 # show debug prints? warning: spams console
 ADVANCED_LOGGING_SHOW_DEBUG = True
+# names of the log levels, used when logging without a logger
+LOG_LEVEL_NAMES = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
 # show debug draws on screen? eg. bounding boxes
 PERFORM_DEBUG_DRAWS = True
 # screen dimensions
@@ -68,47 +76,42 @@ import pygame  # the one and only
 
 from pygame import Vector2  # this is used a lot
 
+import numpy as np  # tile grid storage
 
-def weight_point_in_circle(
-        point: tuple,
-        center: tuple,
-        radius: int,
-        corner_threshold: float = 1.5
-):
+
+def weight_circle(radius: int, corner_threshold: float = 1.5):
     """
-    Function to decide whether a certain grid coordinate should be a full, half or empty tile.
+    Function to decide whether every grid cell within `radius` of a center cell should be a full, half or empty tile.
 
         Arguments:
-            point (tuple): x, y of the point to be tested
-            center (tuple): x, y of the origin (center) point
             radius (int): radius of certainly empty tiles, does not include half tiles
             corner_threshold (float): threshold that decides if the tile should be a half tile instead of empty
 
         Returns:
-            int: the type of the tested tile
+            numpy.ndarray: (2 * radius + 1) square uint8 array of tile types, the center cell in the middle
 
             0 if empty tile
             1 if full tile
             2 if half tile
     """
-    diff_x, diff_y = map(lambda x, y: abs(x - y), center, point)  # subtract point from center then abs for both x and y
-
-    if (diff_y > radius) or (diff_x > radius):
-        return 0  # eliminate any obviously out of bounds tiles
+    # distances of every row and column from the center, broadcast against each other below
+    diff_y, diff_x = np.ogrid[-radius:radius + 1, -radius:radius + 1]
+    diff_x = np.abs(diff_x)
 
-    # precalculate pythagoras distance squared
+    # pythagoras distance squared of every cell
     dist_squared = (diff_x * diff_x) + (diff_y * diff_y)
     # precalculate radius sqaured
     radius_squared = radius * radius
-    # precalculate rounded distance
-    rounded_distance = round(dist_squared)
 
-    if rounded_distance < radius_squared:  # distance within radius
-        return 1  # full tile
-    elif rounded_distance < radius_squared * corner_threshold and diff_x < radius:  # distance on edge
-        return 2  # half tile
-    # outside of any thresholds
-    return 0  # empty tile
+    return np.where(
+        dist_squared < radius_squared,  # distance within radius
+        1,  # full tile
+        np.where(
+            (dist_squared < radius_squared * corner_threshold) & (diff_x < radius),  # distance on edge
+            2,  # half tile
+            0  # empty tile
+        )
+    ).astype(np.uint8)
 
 
 def cell_from_screenspace(screenspace_coords: tuple, tile_size: int):
@@ -122,12 +125,53 @@ def cell_from_screenspace(screenspace_coords: tuple, tile_size: int):
     Returns:
         Tuple[int, int]: Array containing the X and Y values of the corresponding tile coordinate.
     """
-    return tuple(
-        map(
-            lambda n: int(n * (1 / tile_size)),
-            screenspace_coords
-        )
-    )
+    # int() truncates towards zero, so coordinates just outside the top/left edge still land in cell 0
+    return int(screenspace_coords[0] / tile_size), int(screenspace_coords[1] / tile_size)
+
+
+# textures that have already been loaded & converted, keyed by path and alpha, see `load_texture`
+_TEXTURE_CACHE = {}
+
+
+def load_texture(*path: str, alpha: bool = True):
+    """
+    Helper function to load an image from the resources' img folder, converted to the display's pixel format.
+    Every image is only loaded once, loading it again returns the cached surface.
+    The display mode has to be set before calling this.
+
+    Parameters:
+        path (str): Path segments of the image, relative to the img folder.
+        alpha (Optional[bool]): Whether the image has per-pixel alpha, False for opaque images.
+
+    Returns:
+        Surface: The loaded & converted image. It is shared, so it should not be drawn onto.
+    """
+    full_path = os.path.join(RES_FOLDER, 'img', *path)
+    texture = _TEXTURE_CACHE.get((full_path, alpha))
+
+    if texture is None:  # first time this image is requested
+        texture = pygame.image.load(full_path)
+        texture = texture.convert_alpha() if alpha else texture.convert()
+        _TEXTURE_CACHE[(full_path, alpha)] = texture
+
+    return texture
+
+
+@lru_cache(maxsize=256)
+def render_text(font: pygame.font.Font, text: str, color: tuple):
+    """
+    Helper function to render text without antialiasing, reusing the result if the same text was rendered recently.
+    Meant for text that stays the same for many frames, like menus & buttons.
+
+    Parameters:
+        font (Font): The font to render with.
+        text (str): The text to render.
+        color (Tuple[int, int, int]): The text colour.
+
+    Returns:
+        Surface: The rendered text. It is shared, so it should not be drawn onto.
+    """
+    return font.render(text, False, color)
 
 
 def open_github():
@@ -161,6 +205,21 @@ class Game:
         List of game objects to be updated
         Note that index 0 should always be reserved for the player
 
+    current_player, enemy : Player, Enemy
+        The player & enemy of the current game, slots 0 and 1 of the gameplay objects
+
+    rotation_cache : dict{Tuple[Surface, int] : Tuple[Surface, float, float]}
+        Rotated images keyed by the original image and whole degree angle, along with their drawing offsets
+        Shared by all game objects, see method `get_rotated`
+
+    ui_text_cache : dict{Any : Tuple[str, Tuple[int, int, int], Surface]}
+        The last text rendered into each slot of the gameplay sidebar, with its colour and rendered surface
+        See method `render_ui_text`
+
+    draw_order : List[GameObject]
+        `objects` sorted by draw priority, re-sorted only when the objects or their priorities change
+        See method `draw_objects`
+
     event_callback_ingame : dict{pygame.event.Event : function}
         Bindings from PyGame events to class methods
         If a method is within this list, it should have at least one variable to catch the original event
@@ -172,19 +231,23 @@ class Game:
         Note the extra `e` argument here. Although it may be unused, it is required for that function
         to be within the event_callback dictionary.
 
-    keys_down : List[int]
-        List of currently pressed keys, usually referenced by game objects
+    keys_down : Set[int]
+        Set of currently pressed keys, usually referenced by game objects
 
     textures : Game.Textures
         Texture handler for all game sprites, referenced upon creation of GameObject
 
-    tile_grid : List[List[int], ...]
-        Two-dimensional array containing the state of each tile
+    tile_grid : numpy.ndarray
+        Two-dimensional uint8 array containing the state of each tile, indexed as tile_grid[row, column]
         this can represent:
             * 0 for full (visually transparent)
             * 1 for empty (visually mown)
             * 2 for half (visually half-mown)
 
+    tile_overlay : pygame.Surface
+        Transparent surface with the non-full tiles of `tile_grid` rendered onto it
+        Updated tile by tile whenever the tile grid changes, see method `update_path`
+
     path_radius : int
         radius within which to generate path
         called upon pre-baking of the path quadrant
@@ -195,6 +258,10 @@ class Game:
         this quadrant is generated once at the beginning, then masked four times
         every frame depending on the player's tile position
         see method `update_path` to see this in action
+
+    path_stamp : numpy.ndarray
+        the path quadrant mirrored four times into the full (2r+1)x(2r+1) area around the player
+        half tiles below the player's row are left out, as the path never draws them
     """
 
     def __init__(self, logger: logging.Logger = None):
@@ -209,11 +276,26 @@ class Game:
         self.running = False
         # the game's logger
         self.logger = logger
-
-        # frame where the playing field is
+        # logger methods for each level, resolved once instead of on every log call
+        self.log_callbacks = None
+        if logger is not None:
+            self.log_callbacks = (logger.debug, logger.info, logger.warning, logger.error)
+        # messages below this level are dropped straight away
+        self.log_min_level = 0 if ADVANCED_LOGGING_SHOW_DEBUG else 1
+
+        # frame where the playing field is, becomes a subsurface of the screen once the screen is initialized
         self.frame: pygame.Surface = pygame.Surface((FRAME_W, FRAME_H))
+        # areas of the screen around the frame, which get filled with the background colour
+        self.frame_surroundings = ()
+        # scaled down copy of the frame taken when the game was paused, shown in the pause menu
+        self.paused_frame: pygame.Surface = None
         # screen
         self.screen: pygame.Surface = None  # initialized later
+        # size of the screen & frame, cached so the many UI position calculations don't have to ask the surfaces
+        self.screen_w, self.screen_h = SCREEN_W, SCREEN_H
+        self.frame_w, self.frame_h = FRAME_W, FRAME_H
+        # screen background colour, mapped to the screen's pixel format once the screen exists
+        self.screen_bg_color = 0x262626
 
         # framerate cap clock
         self.screen_clock = None
@@ -224,6 +306,19 @@ class Game:
 
         # list of GameObject's to get ticked
         self.objects = []
+        # the player & enemy of the current game, kept so they don't have to be searched for in the object list
+        self.current_player = None
+        self.enemy = None
+        # rotated images of every game object, so each image is only rotated once per angle
+        self.rotation_cache = {}
+        # the last rendered text of every sidebar slot, so text is only rendered again when it changes
+        self.ui_text_cache = {}
+        # objects sorted by their draw priority
+        self.draw_order = []
+        # the object list the draw order was sorted from
+        self.draw_order_source = None
+        # has an object been added, removed or re-prioritised since the draw order was sorted?
+        self.draw_order_dirty = True
         # dict of events and their corresponding functions to be run during gameplay
         self.event_callback_ingame = {
             pygame.QUIT: self.event_quit,
@@ -234,8 +329,8 @@ class Game:
         self.event_callback_menu = {
             pygame.QUIT: self.event_quit
         }
-        # currently pressed down keys
-        self.keys_down = []
+        # currently pressed down keys, a set so membership checks are constant time
+        self.keys_down = set()
 
         # textures to load
         self.textures = None
@@ -245,16 +340,23 @@ class Game:
         self.sounds = None
 
         # background tile grid array
-        self.tile_grid = []
+        self.tile_grid = np.zeros((0, 0), dtype=np.uint8)
 
         # tile grid size
         self.tile_grid_w = 0
         self.tile_grid_h = 0
 
+        # pre-rendered tile grid, blitted over the background in one go
+        self.tile_overlay: pygame.Surface = None
+        # cell the player's path was last stamped at, None if the path hasn't been stamped yet
+        self.last_path_cell = None
+
         # player trail radius
         self.path_radius = 2
         # player path quadrant
         self.path_template = []
+        # full player path, mirrored from the quadrant
+        self.path_stamp = np.zeros((0, 0), dtype=np.uint8)
 
         # total power used so far
         self.power_used = 0
@@ -282,8 +384,10 @@ class Game:
         self.time_started = 0
         # frames rendered since the game has started
         self.frames_since_game_start = 0
-        # last powerup usage timestamp
-        self.last_powerup_used_at = 0
+        # seconds between powerup spawns
+        self.powerup_spawn_interval = 10
+        # timestamp after which the next powerup spawns, worked out once per spawn
+        self.next_powerup_at = 0
         # how many powerups were used?
         self.powerups_used = 0
         # self explanatory, powerup names keyed to their ID's
@@ -322,7 +426,9 @@ class Game:
     class Textures:
         """
         Class to hold all of the game's required textures.
-        Initialize to load them.
+        Initialize to load them, only once the display mode has been set.
+        Every texture is converted to the display's pixel format on load, so blitting them
+        does not have to convert pixels every frame.
 
         Attributes:
             base_tile_size : int
@@ -341,14 +447,13 @@ class Game:
             tile_half : Surface
                 Half-mown tile texture (green/brown)
 
-            tile_mappings : List[Optional(Surface)]
+            tile_mappings : Tuple[Optional(Surface), Surface, Surface]
                 Tile textures mapped to indexes
 
                 In order of indices:
                     * None (transparent)
                     * Empty Tile
                     * Half Tile
-                    * Dev Tile (unused)
 
             player : Surface
                 The player's texture.
@@ -357,6 +462,8 @@ class Game:
             tile_bg_grass : Surface
                 Singluar big grass tile.
                 Replicated for entire background
+            tile_bg_grass_rot : Tuple[Surface, ...]
+                The big grass tile rotated by 0, 90, 180 and 270 degrees
             screen_full_bg : Surface
                 Replicated background of big tiles to fit entire screen
             full_bg : Surface
@@ -371,6 +478,8 @@ class Game:
             enemy_stun : Surface
                 Texture for the enemy when stunned
                 Scaled to base enemy size
+            enemy_flipped : dict{Surface : Surface}
+                Horizontally mirrored copies of all enemy textures, keyed by the original texture
 
             wallet_icon : Surface
                 Small wallet icon displayed next to progress bar
@@ -405,36 +514,35 @@ class Game:
             self.base_player_size = (150, 60)
 
             # tiles
-            self.tile_dev = pygame.image.load(
-                os.path.join(RES_FOLDER, 'img', 'tiles', 'dev.png')
-            )
-            self.tile_empty = pygame.image.load(
-                os.path.join(RES_FOLDER, 'img', 'tiles', 'empty.png')
-            )
-            self.tile_half = pygame.image.load(
-                os.path.join(RES_FOLDER, 'img', 'tiles', 'half.png')
-            )
+            self.tile_dev = load_texture('tiles', 'dev.png', alpha=False)
+            self.tile_empty = load_texture('tiles', 'empty.png', alpha=False)
+            self.tile_half = load_texture('tiles', 'half.png', alpha=False)
 
             # accessed from tilemap
-            self.tile_mappings = [
+            self.tile_mappings = (
                 None,  # 0 -> full tile
                 self.tile_empty,  # 1 -> empty tile
-                self.tile_half,  # 2 -> half tile,
-                self.tile_dev
-            ]
+                self.tile_half  # 2 -> half tile
+            )
 
             # background tile
             self.tile_bg_grass = pygame.transform.scale(
-                pygame.image.load(
-                    os.path.join(RES_FOLDER, 'img', 'tiles', 'bgtile.png')
-                ), (self.base_bg_tile_size, self.base_bg_tile_size)
+                load_texture('tiles', 'bgtile.png', alpha=False),
+                (self.base_bg_tile_size, self.base_bg_tile_size)
+            )
+            # every quarter turn of the background tile, rotated once here instead of once per baked tile
+            self.tile_bg_grass_rot = tuple(
+                pygame.transform.rotate(self.tile_bg_grass, angle) for angle in (0, 90, 180, 270)
             )
 
-            # player sprite
+            # player sprite, it is paletted so key out the background colour (top left pixel) before
+            # converting, otherwise the black outline would share a colorkey with the background
+            player = pygame.image.load(
+                os.path.join(RES_FOLDER, 'img', 'char.png')
+            )
+            player.set_colorkey(player.get_at_mapped((0, 0)))
             self.player = pygame.transform.scale(
-                pygame.image.load(
-                    os.path.join(RES_FOLDER, 'img', 'char.png')
-                ), self.base_player_size
+                player.convert_alpha(), self.base_player_size
             )
 
             # replicated background that should fill the frame, see Game.bake_background_texture
@@ -445,9 +553,7 @@ class Game:
             # enemy kicking cycle
             self.enemy_kick = [
                 pygame.transform.scale(
-                    pygame.image.load(
-                        os.path.join(RES_FOLDER, 'img', 'enemy', f'kick{i}.png')
-                    ), self.base_enemy_size
+                    load_texture('enemy', f'kick{i}.png'), self.base_enemy_size
                 )
                 for i in (0, 1)
             ]
@@ -455,30 +561,30 @@ class Game:
             # enemy running cycle
             self.enemy_run = [
                 pygame.transform.scale(
-                    pygame.image.load(
-                        os.path.join(RES_FOLDER, 'img', 'enemy', f'run{i}.png')
-                    ), self.base_enemy_size
+                    load_texture('enemy', f'run{i}.png'), self.base_enemy_size
                 )
                 for i in (0, 1, 2, 1)
             ]
 
             # enemy stunned frame
             self.enemy_stun = pygame.transform.scale(
-                pygame.image.load(
-                    os.path.join(RES_FOLDER, 'img', 'enemy', 'stun.png')
-                ), self.base_enemy_size
+                load_texture('enemy', 'stun.png'), self.base_enemy_size
             )
 
+            # mirror every enemy texture once, so the enemy doesn't have to flip its image every frame
+            self.enemy_flipped = {
+                texture: pygame.transform.flip(texture, True, False)
+                for texture in (*self.enemy_kick, *self.enemy_run, self.enemy_stun)
+            }
+
             # wallet UI icon
-            self.wallet_icon = pygame.image.load(
-                os.path.join(RES_FOLDER, 'img', 'wallet.png')
-            )
+            self.wallet_icon = load_texture('wallet.png')
 
             # powerup textures
             self.powerups = (
-                pygame.image.load(os.path.join(RES_FOLDER, 'img', 'powerups', 'speed.png')),
-                pygame.image.load(os.path.join(RES_FOLDER, 'img', 'powerups', 'money.png')),
-                pygame.image.load(os.path.join(RES_FOLDER, 'img', 'powerups', 'stun.png')),
+                load_texture('powerups', 'speed.png'),
+                load_texture('powerups', 'money.png'),
+                load_texture('powerups', 'stun.png'),
             )
 
             # powerup textures resized to be smaller; icons
@@ -487,36 +593,26 @@ class Game:
             ]
 
             # main menu title
-            self.title = pygame.image.load(
-                os.path.join(RES_FOLDER, 'img', 'title.png')
-            )
+            self.title = load_texture('title.png')
 
             # large button texture
             self.button = [
-                pygame.image.load(
-                    os.path.join(RES_FOLDER, 'img', 'ui', 'button', f'{i}.png')
-                )
+                load_texture('ui', 'button', f'{i}.png')
                 for i in (0, 1, 2)
             ]
 
             # small, square button
             self.button_small = [
-                pygame.image.load(
-                    os.path.join(RES_FOLDER, 'img', 'ui', 'smallbutton', f'{i}.png')
-                )
+                load_texture('ui', 'smallbutton', f'{i}.png')
                 for i in (0, 1, 2)
             ]
 
             # popup background
-            self.bg_frame = pygame.image.load(
-                os.path.join(RES_FOLDER, 'img', 'ui', 'frame.png')
-            )
+            self.bg_frame = load_texture('ui', 'frame.png')
 
             # keycap sprites, used in how to play
             self.keycaps = [
-                pygame.image.load(
-                    os.path.join(RES_FOLDER, 'img', 'ui', 'keycaps', f'{i}.png')
-                )
+                load_texture('ui', 'keycaps', f'{i}.png')
                 for i in ('a', 'd')
             ]
 
@@ -557,8 +653,9 @@ class Game:
             sound_volume : float
                 Volume of all of the loaded WAVE sounds
 
-            music : Sound
+            music_path : str
                 Background music loop during gameplay, looped forever
+                Streamed from disk through pygame.mixer.music instead of being decoded into memory
             select : Sound
                 SFX when a button is clicked & when player lands from kick
             kick : Sound
@@ -570,11 +667,10 @@ class Game:
             # sound volume scale
             self.sound_volume = 0.1
 
-            # load background music
-            self.music = pygame.mixer.Sound(
-                os.path.join(RES_FOLDER, 'sfx', 'music.wav')
-            )
-            self.music.set_volume(self.sound_volume)  # scale sound down to volume
+            # prepare the background music stream, it is read from disk bit by bit while playing
+            self.music_path = os.path.join(RES_FOLDER, 'sfx', 'music.wav')
+            pygame.mixer.music.load(self.music_path)
+            pygame.mixer.music.set_volume(self.sound_volume)  # scale music down to volume
 
             # load button click sfx
             self.select = pygame.mixer.Sound(
@@ -596,23 +692,19 @@ class Game:
 
     def log(self, msg: str, level: int = 1):
         """
-        Log things to the console. Respects USE_ADVANCED_LOGGING.
+        Log things to the console. Respects USE_ADVANCED_LOGGING and ADVANCED_LOGGING_SHOW_DEBUG.
 
         Parameters:
             msg (str): Message to log to the console.
             level (Optional[int]): Message severity: 0 DEBUG, 1 INFO, 2 WARNING, 3 CRITICAL
 
         """
-        if self.logger is not None:
-            callback = [
-                self.logger.debug,
-                self.logger.info,
-                self.logger.warning,
-                self.logger.error
-            ]
-            callback[level](msg)
+        if level < self.log_min_level:
+            return  # this message would be filtered out anyway, don't bother
+        if self.log_callbacks is not None:
+            self.log_callbacks[level](msg)
             return  # run the corresponding function with the `msg` argument then return
-        print(f'[{["DEBUG", "INFO", "WARNING", "ERROR"][level]}] : {msg}')  #
+        print(f'[{LOG_LEVEL_NAMES[level]}] : {msg}')
 
     @property
     def player(self):
@@ -620,17 +712,17 @@ class Game:
         Returns the first element in the objects array.
         Since this should always be the player during gameplay, this is a shortcut.
         """
-        if len(self.objects):  # only do it if there's enough objects
-            r = self.objects[0]
-            if isinstance(r, Player):  # do not return it if it isn't a player
-                return r
+        objects = self.objects
+        # do not return it if the gameplay objects aren't the current ones (eg. in a menu)
+        if objects and objects[0] is self.current_player:
+            return self.current_player
         return None  # return nothing otherwise
 
     # ---------------- Essential ----------------
 
     def update_delta(self):
         """Synchronise the frame timedelta for the last frame."""
-        now = time.time()
+        now = time.perf_counter()  # monotonic & high resolution, unlike the wall clock
         self.frame_delta = now - self.last_frame
         self.frame_delta = self.frame_delta * TARGET_FRAMERATE
         self.last_frame = now
@@ -642,10 +734,6 @@ class Game:
         Returns the exit code for the game, run this last.
         Raises any exception that occurred during any part of the game.
         """
-        # load the textures
-        self.log('Loading textures...')
-        self.textures = self.Textures()
-
         # load the fonts
         self.log('Loading fonts...')
         pygame.font.init()
@@ -653,6 +741,8 @@ class Game:
 
         # load sounds
         self.log('Loading sounds...')
+        # 44.1kHz 16-bit stereo with a small buffer, so sound effects play without a noticeable delay
+        pygame.mixer.pre_init(44100, -16, 2, 512)
         pygame.mixer.init()
         self.sounds = self.Sounds()
 
@@ -665,6 +755,32 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_W, SCREEN_H), pygame.DOUBLEBUF)
         # create the frame clock, which limits the framerate down to TARGET_FRAMERATE
         self.screen_clock = pygame.time.Clock()  # frame clock
+        # map the background colour once, so filling the screen doesn't have to convert it every frame
+        self.screen_bg_color = self.screen.map_rgb((0x26, 0x26, 0x26))
+
+        # make the frame share its pixels with the screen, so it never has to be blitted onto it
+        frame_rect = pygame.Rect(10, 10, FRAME_W, FRAME_H)
+        self.frame = self.screen.subsurface(frame_rect)
+        # remember the real sizes of both
+        self.screen_w, self.screen_h = self.screen.get_size()
+        self.frame_w, self.frame_h = self.frame.get_size()
+        # strips of the screen above, below, left and right of the frame
+        self.frame_surroundings = (
+            pygame.Rect(0, 0, SCREEN_W, frame_rect.top),
+            pygame.Rect(0, frame_rect.bottom, SCREEN_W, SCREEN_H - frame_rect.bottom),
+            pygame.Rect(0, frame_rect.top, frame_rect.left, frame_rect.height),
+            pygame.Rect(frame_rect.right, frame_rect.top, SCREEN_W - frame_rect.right, frame_rect.height)
+        )
+
+        # only let events that have a callback into the queue, SDL drops the rest (eg. mouse motion)
+        # mouse state is still polled every frame, so it doesn't need any events
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.event_callback_ingame.keys() | self.event_callback_menu.keys()))
+
+        # load the textures, this has to happen after the display is set up so
+        # they can be converted to the screen's pixel format
+        self.log('Loading textures...')
+        self.textures = self.Textures()
 
         # make a quadrant of the player path
         self.log(f'Baking path quadrant...')
@@ -687,16 +803,25 @@ class Game:
         self.running = True
 
         # set initial value for last frame timestamp
-        self.last_frame = time.time()
-        # set initial value for powerup timestamp
-        self.last_powerup_used_at = self.last_frame
+        self.last_frame = time.perf_counter()
+        # the first powerup spawns one interval in
+        self.next_powerup_at = self.last_frame + self.powerup_spawn_interval
+
+        # bind the functions called every loop, so they don't have to be looked up every time
+        update_delta = self.update_delta
+        process_events = self.process_events
+        get_events = pygame.event.get
+        get_mouse_pos = pygame.mouse.get_pos
+        get_mouse_pressed = pygame.mouse.get_pressed
+        clock_tick = self.screen_clock.tick
+        flip_display = pygame.display.flip
 
         while self.running:  # main loop, run while game is up
-            self.update_delta()  # update the frame delta
+            update_delta()  # update the frame delta
 
             # update mouse state
-            self.mouse_pos = pygame.mouse.get_pos()
-            self.mouse_pressed = pygame.mouse.get_pressed()
+            self.mouse_pos = get_mouse_pos()
+            self.mouse_pressed = get_mouse_pressed()
 
             if self.game_started:
                 # the game is not in the main menu
@@ -710,7 +835,7 @@ class Game:
                     # draw everything
                     self.full_draw()
                     # process the event queue
-                    self.process_events(pygame.event.get())
+                    process_events(get_events())
                     # try to spawn a powerup
                     self.try_spawn_powerup()
 
@@ -721,14 +846,17 @@ class Game:
                 else:
                     # the game is in the pause menu
                     self.draw_pause_menu()
-                    self.process_events(pygame.event.get())
+                    process_events(get_events())
             else:
                 # the game is in the main menu
                 self.draw_main_menu()
                 # process the event queue in the main menu
-                self.process_events(pygame.event.get())
+                process_events(get_events())
+            if self.running:  # quitting above shuts the display down
+                # the draw methods above only draw to the screen, show it all at once here
+                flip_display()
             # limit the framerate to 60fps (VSYNC double buffer)
-            self.screen_clock.tick(TARGET_FRAMERATE)
+            clock_tick(TARGET_FRAMERATE)
         # no errors, the function will raise an error otherwise
         self.log('Game exited normally', 0)
         return 0
@@ -755,19 +883,21 @@ class Game:
             # start off with an enemy
             Enemy(parent=self, start_x=500, start_y=500, start_angle=0, image=self.textures.enemy_kick[0]),
         ]
+        # keep direct references to both
+        self.current_player, self.enemy = self.objects
         # pause button visible during gameplay
-        self.pause_button = Button(self, self.frame.get_width()+20, self.screen.get_height()-74, 'P', self.textures.button_small, self.set_paused)
+        self.pause_button = Button(self, self.frame_w+20, self.screen_h-74, 'P', self.textures.button_small, self.set_paused)
 
         self.log(f'{len(self.objects):,} objects active', 0)
 
         # set enemy target
-        self.objects[1].target = self.player
+        self.enemy.target = self.current_player
 
         # play & loop the music forever
-        self.sounds.music.play(loops=100)
+        pygame.mixer.music.play(-1)
 
         # mark this point at which the game started
-        self.time_started = time.time()
+        self.time_started = time.perf_counter()
 
         # tell the mainloop to start updating the gameplay
         self.game_started = True
@@ -786,13 +916,13 @@ class Game:
         elif self.main_menu_page == 2:
             # Credits Screen
             self.objects = [
-                Button(self, self.screen.get_width() / 2 - 150, 450, 'GitHub', self.textures.button, open_github),
-                Button(self, self.screen.get_width() / 2 - 150, 620, 'Back', self.textures.button, self.switch_main_menu_page, [0])
+                Button(self, self.screen_w / 2 - 150, 450, 'GitHub', self.textures.button, open_github),
+                Button(self, self.screen_w / 2 - 150, 620, 'Back', self.textures.button, self.switch_main_menu_page, [0])
             ]
         else:
             # How to Play Screen
             self.objects = [
-                Button(self, self.screen.get_width() / 2 - 150, 620, 'Back', self.textures.button, self.switch_main_menu_page, [0])
+                Button(self, self.screen_w / 2 - 150, 620, 'Back', self.textures.button, self.switch_main_menu_page, [0])
             ]
 
     def draw_main_menu(self):
@@ -819,9 +949,9 @@ your owner. He won't hesitate.
             self.show_info_screen('How To Play', instructions)
 
             # add some extra text for controls, leave gaps to fit textures
-            control_text = self.fonts.arcade_25.render('Use   and   to turn the lawnmower.', False, (61, 64, 66))
+            control_text = render_text(self.fonts.arcade_25, 'Use   and   to turn the lawnmower.', (61, 64, 66))
             # find middle of said control help text
-            control_text_x = (self.screen.get_width() / 2) - (control_text.get_width() * 0.5)
+            control_text_x = (self.screen_w / 2) - (control_text.get_width() * 0.5)
             # render control help text
             self.screen.blit(
                 control_text,
@@ -845,13 +975,13 @@ By Martin Velikov (xxcodianxx)
             # show an info screen with the credits
             self.show_info_screen(f'Power Lawn', credits_text)
 
-        # tick the buttons
+        # tick the buttons, keeping the list they came from
+        buttons = self.objects
         self.tick_objects()
-        # draw the buttons
-        self.draw_objects()
-
-        # update the entire display
-        pygame.display.update()
+        # draw the buttons, unless a button's callback swapped them out (eg. for the gameplay objects)
+        # the frame is part of the screen, so drawing those here would put them on top of the menu
+        if self.objects is buttons:
+            self.draw_objects()
 
     def switch_main_menu_page(self, page):
         """
@@ -877,7 +1007,7 @@ By Martin Velikov (xxcodianxx)
             description (str): The window description
         """
         # find middle of screen
-        middle = self.screen.get_width() / 2
+        middle = self.screen_w / 2
         # draw a window frame to the middle of the screen
         self.screen.blit(
             self.textures.bg_frame,
@@ -886,7 +1016,7 @@ By Martin Velikov (xxcodianxx)
         )
 
         # render the title in large font
-        title = self.fonts.arcade_50.render(title, False, (61, 64, 66))
+        title = render_text(self.fonts.arcade_50, title, (61, 64, 66))
         # render said font to middle
         self.screen.blit(
             title,
@@ -897,7 +1027,7 @@ By Martin Velikov (xxcodianxx)
         # for every line in the description
         for idx, line in enumerate(description.splitlines()):
             # render the line in small text
-            line_text = self.fonts.arcade_25.render(line, False, (61, 64, 66))
+            line_text = render_text(self.fonts.arcade_25, line, (61, 64, 66))
             # draw it at the offset coordinate, influenced by idx which is the line number
             self.screen.blit(
                 line_text,
@@ -918,16 +1048,19 @@ By Martin Velikov (xxcodianxx)
         if self.game_over:  # is the pause menu continuable or permanent?
             # it's a game over menu, do not allow continuation
             self.objects = [
-                Button(self, self.screen.get_width() / 2 - 150, 620, 'Continue', self.textures.button, self.reset_to_main_menu),
+                Button(self, self.screen_w / 2 - 150, 620, 'Continue', self.textures.button, self.reset_to_main_menu),
             ]
         else:
             # it's a regular pause menu, allow continuation
             self.objects = [
-                Button(self, self.screen.get_width() / 2 - 350, 620, 'Main Menu', self.textures.button, self.reset_to_main_menu),
-                Button(self, self.screen.get_width() / 2 + 50, 620, 'Continue', self.textures.button, self.continue_game)
+                Button(self, self.screen_w / 2 - 350, 620, 'Main Menu', self.textures.button, self.reset_to_main_menu),
+                Button(self, self.screen_w / 2 + 50, 620, 'Continue', self.textures.button, self.continue_game)
             ]
+        # the frame is part of the screen, which the menu draws over, so keep a copy of it for the mini-frame
+        # it is frozen while paused, so scale it down once here instead of every menu frame
+        self.paused_frame = pygame.transform.scale(self.frame, (300, 300))
         # stop the music
-        self.sounds.music.stop()
+        pygame.mixer.music.stop()
 
     def draw_pause_menu(self):
         """Draw the pause menu with whatever contents are required"""
@@ -940,10 +1073,10 @@ By Martin Velikov (xxcodianxx)
             # show a base info screen
             self.show_info_screen('Paused', '       The game is paused.')
 
-            # mini-frame scaled size
-            newsize = (300, 300)
+            # mini-frame scaled size, the frame was scaled to this when the game was paused
+            newsize = self.paused_frame.get_size()
             # offset coordinates of mini-frame
-            newpos = (self.screen.get_width() / 2 - newsize[0]*0.5, 200)
+            newpos = (self.screen_w / 2 - newsize[0]*0.5, 200)
             # size of border around mini-frame
             margins = (4, 4)
 
@@ -955,24 +1088,25 @@ By Martin Velikov (xxcodianxx)
                 newsize[1] + (margins[1])
             ))
             # draw a scaled-down version of the frame
-            self.screen.blit(pygame.transform.scale(self.frame, newsize), newpos)
+            self.screen.blit(self.paused_frame, newpos)
         else:
             # draw the game over screen instead
             self.draw_game_over_screen()
 
-        # tick buttons
+        # tick buttons, keeping the list they came from
+        buttons = self.objects
         self.tick_objects()
-        # draw buttons
-        self.draw_objects()
-
-        # update display
-        pygame.display.update()
+        # draw buttons, unless continuing swapped them out for the gameplay objects
+        # the frame is part of the screen, so drawing those here would put them on top of the menu
+        if self.objects is buttons:
+            self.draw_objects()
 
     def continue_game(self):
         """Continue the game from where it left off, exit pause menu."""
         self.objects = self.game_objects  # restore gameplay objects from backup
         self.paused = False  # tell the mainloop to unpause
-        self.sounds.music.play()  # music, maestro!
+        self.paused_frame = None  # the mini-frame is only needed while paused
+        pygame.mixer.music.play(-1)  # music, maestro!
 
     def reset_to_main_menu(self):
         """Reset all game states and return to the main menu."""
@@ -995,7 +1129,7 @@ By Martin Velikov (xxcodianxx)
         """Set the state of the game to indicate a game over"""
         self.paused = True  # tell the pause screen to show, it will redirect to the game over screen
         self.game_over = True  # tell the pause screen & mainloop that the game has ended
-        self.duration = time.time() - self.time_started  # calculate the duration to be used in the end screen
+        self.duration = time.perf_counter() - self.time_started  # calculate the duration to be used in the end screen
 
     def draw_game_over_screen(self):
         """Draw the game over screen & show stats."""
@@ -1037,36 +1171,39 @@ Have another shot, will ya?
             [0, 0, 0, 0, (...)],
         ]
         Where each number represents the tile state - here, 0 is full tile.
-        To reference any cell within it: tilemap[row][column]
+        To reference any cell within it: tilemap[row, column]
         """
-        self.tile_grid = []  # reset the tile grid
-        self.tile_grid_h = 0  # reset the recorded height
-        # set the width to that of the first element
-        self.tile_grid_w = divmod(self.frame.get_width(), self.textures.base_tile_size)[0]
-
-        # range acting as a divmod
-        for _ in range(0, self.frame.get_height(), self.textures.base_tile_size):
-            # append a row of 0's until row index exausted by range()
-            self.tile_grid.append(
-                [0 for _ in range(0, self.frame.get_width(), self.textures.base_tile_size)]
-            )
-            # add one to height
-            self.tile_grid_h += 1
+        # one tile for every started tile size, same as stepping through the frame with range()
+        self.tile_grid_w = -(-self.frame_w // self.textures.base_tile_size)
+        self.tile_grid_h = -(-self.frame_h // self.textures.base_tile_size)
+
+        if self.tile_grid.shape == (self.tile_grid_h, self.tile_grid_w) and self.tile_overlay is not None:
+            # a new game on the same frame, just wipe the previous game's grid & overlay in place
+            self.tile_grid.fill(0)
+            self.tile_overlay.fill((0, 0, 0, 0))
+        else:
+            # single contiguous array of full tiles instead of a list per row
+            self.tile_grid = np.zeros((self.tile_grid_h, self.tile_grid_w), dtype=np.uint8)
+
+            # transparent overlay the size of the frame, tiles are drawn onto it as the path changes them
+            self.tile_overlay = pygame.Surface(self.frame.get_size(), pygame.SRCALPHA)
+        # the fresh grid has no path on it yet
+        self.last_path_cell = None
 
     def bake_path_quadrant(self):
         """
-        Generate one quadrant of the path to be mirrored later.
-        This is calculated once and saved to quarter_path_template.
-        It is applied every frame from the baked template, without being recalculated. Speed!
+        Generate the path around the player, along with one quadrant of it for reference.
+        This is calculated once and saved to path_stamp and path_template.
+        It is applied every frame from the baked stamp, without being recalculated. Speed!
         """
-        self.path_template = []  # output array
-        for ri in range(self.path_radius + 1):  # row index
-            r = []  # temporary row array
-            for ci in range(self.path_radius + 1):  # column index
-                r.append(  # add the type of that cell to that index, using the weighting function
-                    weight_point_in_circle((ci, ri), (0, 0), self.path_radius)
-                )
-            self.path_template.append(r)  # add the row to the path quadrant
+        # weigh the whole area around the player in one go, it is symmetrical so all quadrants match
+        self.path_stamp = weight_circle(self.path_radius)
+        # the bottom right quadrant, starting at the center cell
+        self.path_template = self.path_stamp[self.path_radius:, self.path_radius:].tolist()
+
+        # half tiles are never drawn below the player, so leave them out of the stamp entirely
+        below = self.path_stamp[self.path_radius + 1:]
+        below[below == 2] = 0
 
         if ADVANCED_LOGGING_SHOW_DEBUG:  # show what the quadrant looks like once baked
             s = ''
@@ -1085,14 +1222,19 @@ Have another shot, will ya?
         # create surface large enough to house texture
         bg = pygame.Surface(size)
 
-        # blit tile texture to larger texture
-        for y in range(0, size[1], self.textures.base_bg_tile_size):
-            for x in range(0, size[0], self.textures.base_bg_tile_size):
-                # rotate by a random 90 degrees to make it feel more organic
-                tile = pygame.transform.rotate(
-                    self.textures.tile_bg_grass, random.choice((0, 90, 180, 270))
+        # blit tile texture to larger texture, all in one batched call
+        bg.blits(
+            [
+                (
+                    # rotate by a random 90 degrees to make it feel more organic
+                    random.choice(self.textures.tile_bg_grass_rot),
+                    (x, y)  # add a tile at those screenspace coords
                 )
-                bg.blit(tile, (x, y))  # add a tile at those screenspace coords
+                for y in range(0, size[1], self.textures.base_bg_tile_size)
+                for x in range(0, size[0], self.textures.base_bg_tile_size)
+            ],
+            doreturn=0  # the affected rects are not needed
+        )
 
         return bg  # return the stitched texture
 
@@ -1106,56 +1248,55 @@ Have another shot, will ya?
         player_cell_x, player_cell_y = cell_from_screenspace(self.player.globalRect.center,
                                                              self.textures.base_tile_size)
 
-        # Now to set up the area around the player, we can just replicate the pregenerated quarter 4 times:
-
-        # iterate through rows (iter as qr), keeping index as qy.
-        for qy, qr in enumerate(self.path_template):
-            # iterate through columns (iter as qc), keeping index as qx.
-            for qx, qc in enumerate(qr):
-                # do not draw empty pixels on the screen.
-                if qc == 0:
-                    continue
-
-                # get tile grid width & height
-
-                # calculate index inverting mutlipliers (-1, 1)
-                right = player_cell_x + qx
-                left = player_cell_x - qx
-                bottom = player_cell_y + qy
-                top = player_cell_y - qy
-
-                quads = (  # quadrants for flipping the tilemap
-                    (bottom, right),
-                    (bottom, left),
-                    (top, left),
-                    (top, right)
-                )
-
-                for y, x in quads:
-                    if min(x, y) > -1 and x < self.tile_grid_w and y < self.tile_grid_h:
-                        if qc == 2 and (  # is the cell about to be drawn a half-cell?
-                                self.tile_grid[y][x] == 1  # is the tile at that position blank?
-                                or
-                                y > player_cell_y  # is the position of the half below the player coordinate?
-                        ):
-                            continue  # do not draw that half-cell
-
-                        # add index in bottom right (original array orientation)
-                        self.tile_grid[y][x] = qc
+        # stamping the path is idempotent, so there is nothing to do if the player hasn't left the cell
+        if (player_cell_x, player_cell_y) == self.last_path_cell:
+            return
+        self.last_path_cell = (player_cell_x, player_cell_y)
+
+        # look these up once instead of once per tile
+        tile_size = self.textures.base_tile_size
+        tile_mappings = self.textures.tile_mappings
+
+        # clip the area covered by the stamp to the tile grid, keeping the matching area of the stamp
+        r = self.path_radius
+        y0, y1 = max(player_cell_y - r, 0), min(player_cell_y + r + 1, self.tile_grid_h)
+        x0, x1 = max(player_cell_x - r, 0), min(player_cell_x + r + 1, self.tile_grid_w)
+        if y0 >= y1 or x0 >= x1:
+            return  # the stamp is entirely outside of the tile grid
+
+        area = self.tile_grid[y0:y1, x0:x1]  # view, writing to it writes to the tile grid
+        stamp = self.path_stamp[y0 - player_cell_y + r:y1 - player_cell_y + r,
+                                x0 - player_cell_x + r:x1 - player_cell_x + r]
+
+        # keep the current tile where the stamp is empty, or where a half tile would cover an already empty one
+        keep = (stamp == 0) | ((stamp == 2) & (area == 1))
+        updated = np.where(keep, area, stamp)
+
+        # keep the overlay in sync by drawing just the changed tiles over the old ones
+        changed = np.argwhere(updated != area)
+        if len(changed):
+            self.tile_overlay.blits(
+                [
+                    (tile_mappings[updated[cy, cx]], ((x0 + cx) * tile_size, (y0 + cy) * tile_size))
+                    for cy, cx in changed.tolist()
+                ],
+                doreturn=0  # the affected rects are not needed
+            )
+            area[...] = updated
 
     def tick_objects(self):
         """Update all game objects & cull picked up powerups."""
-        to_cull = []  # list of objects to be deleted
-        for idx, game_object in enumerate(self.objects):
+        any_inactive = False  # has any object been picked up this frame?
+        for game_object in self.objects:
             game_object.update()  # update object
 
-            if isinstance(game_object, Powerup):
-                if not game_object.active:  # check if powerup is active
-                    to_cull.append(idx)  # if it isn't, then add it to the delete list
+            if not game_object.active:  # check if object is active (ie. powerup not picked up yet)
+                any_inactive = True
 
-        # delete all objects in the killing list
-        for idx in to_cull:
-            del self.objects[idx]
+        if any_inactive:
+            # rebuild the list without the inactive objects in one pass, deleting by index would shift the later ones
+            self.objects = [game_object for game_object in self.objects if game_object.active]
+            self.draw_order_dirty = True
 
     def tick_active_powerups(self):
         """
@@ -1180,18 +1321,16 @@ Have another shot, will ya?
             elif idx == 1:  # reset cost
                 self.current_cost = self.normal_cost
             elif idx == 2:  # un-stun the enemy
-                self.objects[1].stunned = False
+                self.enemy.stunned = False
             # finally, delete the powerup from the active list
             del self.player.active_powerups[idx]
 
-    def try_spawn_powerup(self, every=10):
+    def try_spawn_powerup(self):
         """
         Try to spawn a power-up at a random location.
-
-        Parameters:
-            every (int): succeed in spawning every X seconds
+        Succeeds once every `powerup_spawn_interval` seconds.
         """
-        if time.time() - self.last_powerup_used_at > every:  # has it been more than the spawn time since the last powerup spawn?
+        if self.last_frame > self.next_powerup_at:  # has the spawn time since the last powerup spawn passed?
             type = random.randint(0, len(self.powerup_names.keys())-1)  # if yes, pick one from the registered ones
 
             # get a random cell x and y
@@ -1212,8 +1351,9 @@ Have another shot, will ya?
 
             # add it to the object list to get ticked
             self.objects.append(instance)
-            # mark the time of spawning
-            self.last_powerup_used_at = time.time()
+            self.draw_order_dirty = True
+            # schedule the next spawn
+            self.next_powerup_at = self.last_frame + self.powerup_spawn_interval
 
     # ---------------- Rendering ----------------
 
@@ -1229,35 +1369,101 @@ Have another shot, will ya?
         Render the tilemap to the screen.
         Does not update the player's path. See method `update_path` for that functionality.
         """
-
         # draw the background grid
         self.frame.blit(self.textures.full_bg, (0, 0))
+        # draw the tile overlay on top in a single blit, it is kept up to date by `update_path`
+        self.frame.blit(self.tile_overlay, (0, 0))
+
+    def get_rotated(self, image: pygame.Surface, angle: int):
+        """
+        Rotate an image around its center, reusing the result if that image has been rotated by that angle before.
+
+        Parameters:
+            image (Surface): the image to rotate
+            angle (int): whole degree angle to rotate by, between 0 and 359
+
+        Returns:
+            Tuple[Surface, float, float]: the rotated image, and the x & y offsets to draw it at so it keeps its center
+        """
+        cached = self.rotation_cache.get((image, angle))
+        if cached is None:
+            # this image hasn't been drawn at this angle yet, offset calculation is required
+            img_w, img_h = image.get_size()
+
+            # precalculate the rotation, same convention as Vector2.rotate
+            rad = math.radians(angle)
+            cos_a = math.cos(rad)
+            sin_a = math.sin(rad)
+
+            # the bounding box corners (0, 0), (w, 0), (w, -h) and (0, -h) rotate to
+            # x values 0, w*cos, w*cos + h*sin, h*sin
+            # y values 0, w*sin, w*sin - h*cos, -h*cos
+            # pygame vectors are upside down, so the height is negative
+            w_cos, w_sin = img_w * cos_a, img_w * sin_a
+            h_cos, h_sin = img_h * cos_a, img_h * sin_a
+
+            # get smallest x value in all points' x values
+            min_x = min(0, w_cos, w_cos + h_sin, h_sin)
+
+            # get largest y value in all points' y values
+            max_y = max(0, w_sin, w_sin - h_cos, -h_cos)
+
+            # get center of image
+            center_x = img_w * 0.5  # TODO: center offset, also do globalRect
+            center_y = -(img_h * 0.5)  # pygame vectors are upside down, so this is negative
+
+            # how much should be corrected from the rotation
+            pivot_x = (center_x * cos_a - center_y * sin_a) - center_x
+            pivot_y = (center_x * sin_a + center_y * cos_a) - center_y
+
+            cached = (
+                pygame.transform.rotate(image, angle),  # rotate image
+                min_x - pivot_x,  # x offset
+                pivot_y - max_y  # y offset
+            )
+            self.rotation_cache[(image, angle)] = cached
+        return cached
+
+    def render_ui_text(self, slot, font: pygame.font.Font, text: str, color: tuple):
+        """
+        Render text for a slot of the gameplay sidebar, reusing the last render if the text & colour haven't changed.
+
+        Parameters:
+            slot (Any): key of the place in the sidebar the text is drawn at
+            font (Font): the font to render with
+            text (str): the text to render
+            color (Tuple[int, int, int]): the text colour
 
-        # draw the tile grid
-        for cy, r in enumerate(self.tile_grid):
-            # cell x, column data
-            for cx, c in enumerate(r):
-                if c == 0:
-                    continue  # skip drawing this
-                # get corresponding texture
-                tex = self.textures.tile_mappings[c]
-                # screenspace position
-                ss_pos = (cx * self.textures.base_tile_size, cy * self.textures.base_tile_size)
-                self.frame.blit(tex, ss_pos)
+        Returns:
+            Surface: the rendered text
+        """
+        cached = self.ui_text_cache.get(slot)
+        if cached is None or cached[0] != text or cached[1] != color:
+            # the value shown in this slot has changed since the last frame, render it again
+            cached = (text, color, font.render(text, False, color))
+            self.ui_text_cache[slot] = cached
+        return cached[2]
 
     def draw_objects(self):
         """Draws all game objects to the screen by calling their draw method."""
-        for game_object in sorted(self.objects, key=lambda x: x.draw_priority):
+        # only re-sort if the objects have changed, swapping the object list out (eg. for a menu) counts too
+        if self.draw_order_dirty or self.draw_order_source is not self.objects:
+            self.draw_order = sorted(self.objects, key=attrgetter('draw_priority'))
+            self.draw_order_source = self.objects
+            self.draw_order_dirty = False
+
+        for game_object in self.draw_order:
             game_object.draw()
 
     def draw_ui_and_frame(self):
         """
         Takes care of what everything looks like outside the frame window during gameplay time.
         Assumes everything inside the frame is ready to go.
-        Refreshes the screen this should be the final function call per frame.
+        This should be the final draw call per frame, the caller flips the display afterwards.
         """
-        # fill the screen with a bg color
-        self.screen.fill(0x262626)
+        # fill the screen around the frame with a bg color, the frame itself has already been drawn
+        for rect in self.frame_surroundings:
+            self.screen.fill(self.screen_bg_color, rect)
 
         # get how much of the lawn is completed
         percent, mown = self.get_mown_percentage()
@@ -1267,41 +1473,41 @@ Have another shot, will ya?
 
         # show lawn mowing statistics
         self.screen.blit(
-            self.fonts.arcade_25.render(f'Lawn Stats', False, (142, 142, 142)),
-            (self.frame.get_width() + 20, 10)
+            self.render_ui_text('lawn_title', self.fonts.arcade_25, 'Lawn Stats', (142, 142, 142)),
+            (self.frame_w + 20, 10)
         )
         self.screen.blit(
-            self.fonts.arcade_50.render(f'{format(percent, ".2f")}%', False, (255, 255, 255)),
-            (self.frame.get_width() + 20, 40)
+            self.render_ui_text('percent', self.fonts.arcade_50, f'{format(percent, ".2f")}%', (255, 255, 255)),
+            (self.frame_w + 20, 40)
         )
         self.screen.blit(
-            self.fonts.arcade_25.render(f'{mown} tiles mown', False, (255, 255, 255)),
-            (self.frame.get_width() + 20, 95)
+            self.render_ui_text('mown', self.fonts.arcade_25, f'{mown} tiles mown', (255, 255, 255)),
+            (self.frame_w + 20, 95)
         )
 
         # power usage & cost display
         self.screen.blit(
-            self.fonts.arcade_25.render(f'Power Bills', False, (142, 142, 142)),
-            (self.frame.get_width() + 20, 150)
+            self.render_ui_text('bills_title', self.fonts.arcade_25, 'Power Bills', (142, 142, 142)),
+            (self.frame_w + 20, 150)
         )
-        cost_font = self.fonts.arcade_50.render(
-            f'${round(self.money)}', False,
+        cost_font = self.render_ui_text(
+            'cost', self.fonts.arcade_50, f'${round(self.money)}',
             (82, 148, 226) if self.player.active_powerups.get(1) else (255, 255, 255)
         )
         self.screen.blit(
             cost_font,
-            (self.frame.get_width() + 20, 180)
+            (self.frame_w + 20, 180)
         )
 
-        wattage_display = self.fonts.arcade_25.render(f'{self.power_used}W', False, (210, 210, 210))
-        usage_display = self.fonts.arcade_25.render(
+        wattage_display = self.render_ui_text('wattage', self.fonts.arcade_25, f'{self.power_used}W', (210, 210, 210))
+        usage_display = self.render_ui_text(
+            'usage', self.fonts.arcade_25,
             f'+{self.current_power_consumption}',
-            False,
             (111, 194, 52) if self.current_power_consumption == self.normal_power_consumption else (199, 84, 80)
         )
 
         usage_offset_y = 180 + cost_font.get_height() - (usage_display.get_height() + wattage_display.get_height())
-        usage_offset_x = self.frame.get_width() + 30 + cost_font.get_width()
+        usage_offset_x = self.frame_w + 30 + cost_font.get_width()
 
         self.screen.blit(
             usage_display,
@@ -1314,9 +1520,9 @@ Have another shot, will ya?
         )
 
         # progress bar
-        self.screen.blit(self.textures.wallet_icon, (self.frame.get_width() + 30, 180 + cost_font.get_height()))
+        self.screen.blit(self.textures.wallet_icon, (self.frame_w + 30, 180 + cost_font.get_height()))
 
-        rectx = self.frame.get_width() + 88
+        rectx = self.frame_w + 88
         recty = 188 + cost_font.get_height()
 
         pygame.draw.rect(self.screen, (111, 194, 52), pygame.Rect(rectx, recty, 300, 32))
@@ -1337,11 +1543,11 @@ Have another shot, will ya?
 
         # show active powerups
         if len(self.player.active_powerups.keys()):
-            basex = self.frame.get_width()+20
+            basex = self.frame_w+20
             basey = recty+75
 
             self.screen.blit(
-                self.fonts.arcade_25.render(f'Power Ups', False, (142, 142, 142)),
+                self.render_ui_text('powerups_title', self.fonts.arcade_25, 'Power Ups', (142, 142, 142)),
                 (basex, basey)
             )
 
@@ -1355,7 +1561,10 @@ Have another shot, will ya?
                 # show 0 seconds instead of negative for 1 frame
                 seconds_left = seconds_left if seconds_left >= 0 else 0
                 self.screen.blit(
-                    self.fonts.arcade_25.render(f'{self.powerup_names[id]} {format((seconds_left), ".2f")}s', False, (255, 255, 255)),
+                    self.render_ui_text(
+                        ('powerup', id), self.fonts.arcade_25,
+                        f'{self.powerup_names[id]} {format((seconds_left), ".2f")}s', (255, 255, 255)
+                    ),
                     (basex+35, y_offset)
                 )
                 offset_mult += 1
@@ -1363,11 +1572,7 @@ Have another shot, will ya?
         # update & draw the pause button
         self.pause_button.update()
         self.pause_button.draw()
-
-        # finally, draw the frame
-        self.screen.blit(self.frame, (10, 10))
-        # update the screen
-        pygame.display.update()
+        # the frame is a subsurface of the screen, so it is already on it
 
     # ---------------- Events & Processing ----------------
 
@@ -1377,18 +1582,19 @@ Have another shot, will ya?
         Does not mind which callback is used, uses all available
 
         Parameters:
-            queue : Optional(Tuple[Event]): the event queue
+            queue : Optional(List[Event]): the event queue
         """
 
-        if queue == ():  # save a bit of processing power
+        if not queue:  # save a bit of processing power, nothing happened this frame
             return
 
-        # get the correct binding dictionary for the main menu or ingame game state
-        callback_mapping = (self.event_callback_ingame if self.game_started else self.event_callback_menu)
+        # get the lookup of the correct binding dictionary for the main menu or ingame game state
+        # bound once, so it isn't looked up again for every event
+        get_callback = (self.event_callback_ingame if self.game_started else self.event_callback_menu).get
 
         for e in queue:
             # is the event's callback defined? if yes, run it
-            e_callback = callback_mapping.get(e.type)
+            e_callback = get_callback(e.type)
             if e_callback:
                 e_callback(e)
                 # skip to next loop cycle
@@ -1398,10 +1604,10 @@ Have another shot, will ya?
 
     def event_key(self, e = None):
         """Event callback method to process keypresses."""
-        if (e.type == pygame.KEYDOWN) and (e.key not in self.keys_down):
-            self.keys_down.append(e.key)
-        elif (e.type == pygame.KEYUP) and (e.key in self.keys_down):
-            self.keys_down.remove(e.key)
+        if e.type == pygame.KEYDOWN:
+            self.keys_down.add(e.key)
+        elif e.type == pygame.KEYUP:
+            self.keys_down.discard(e.key)  # no-op if the key wasn't recorded as pressed
 
     def event_quit(self, e = None):
         """Event callback method to quit the game. """
@@ -1416,9 +1622,9 @@ Have another shot, will ya?
         # get player vector
         v_player = Vector2(self.player.x, self.player.y)
         # get distance to right side of frame
-        dist_to_right = int(self.frame.get_width() - self.player.x)
+        dist_to_right = int(self.frame_w - self.player.x)
         # get distance to bottom of frame
-        dist_to_bottom = int(self.frame.get_height() - self.player.y)
+        dist_to_bottom = int(self.frame_h - self.player.y)
 
         # get relative offset from current player pos
         offset = Vector2(
@@ -1427,7 +1633,7 @@ Have another shot, will ya?
         )
 
         # orient the enemy the correct way around
-        self.objects[1].horizontal_flip = not (offset.x < 0)
+        self.enemy.horizontal_flip = not (offset.x < 0)
         end_pos = v_player + offset  # get end position for lerp
 
         self.sounds.kick.play()  # play the kicking sfx
@@ -1444,6 +1650,8 @@ Have another shot, will ya?
             self.tick_active_powerups()
             # draw everything
             self.full_draw()
+            # show the drawn frame
+            pygame.display.flip()
             # limit framerate
             self.screen_clock.tick(TARGET_FRAMERATE)
         # player lands back on ground, play landing sfx (select)
@@ -1451,12 +1659,10 @@ Have another shot, will ya?
 
     def get_mown_percentage(self):
         """Helper function to return how much of the lawn is mown."""
-        mown = 0
-        for r in self.tile_grid:
-            for c in r:
-                if c:
-                    mown += 1
-        return (mown / (70 * 70)) * 100, mown
+        # any tile that isn't full has been mown at least partly, counted in one pass over the array
+        mown = int(np.count_nonzero(self.tile_grid))
+        # divide by the real tile count so the figure follows the grid size
+        return (mown / self.tile_grid.size) * 100, mown
 
 
 class GameObject(pygame.sprite.Sprite):
@@ -1475,13 +1681,15 @@ class GameObject(pygame.sprite.Sprite):
             Local image rect of the sprite.
         globalRect : Rect
             Global rect of image mimicing rect, offset by global coordinates
-
+        active : bool
+            Whether the object is still in play, inactive objects are culled by `Game.tick_objects`
     """
     def __init__(self, parent: Game, start_x=0, start_y=0, start_angle=0, image=None):
         super(GameObject, self).__init__()
-        self.draw_priority = 100  # object update priority, higher = sooner
-
         self.parent = parent
+        self.active = True  # inactive objects get removed from the game
+
+        self._draw_priority = 100  # object update priority, higher = sooner
         if image is None:
             image = pygame.Surface((0, 0))
 
@@ -1497,6 +1705,18 @@ class GameObject(pygame.sprite.Sprite):
             self.rect.w, self.rect.h
         )
 
+    @property
+    def draw_priority(self):
+        """When should this object be drawn in relation to others: higher than other = before"""
+        return self._draw_priority
+
+    @draw_priority.setter
+    def draw_priority(self, value):
+        if value != self._draw_priority:
+            self._draw_priority = value
+            # the game's draw order is out of date now
+            self.parent.draw_order_dirty = True
+
     def update(self):
         """
         Dynamic method to update the state/position/whatever you want of the game object.
@@ -1523,50 +1743,25 @@ class GameObject(pygame.sprite.Sprite):
             image = self.image
 
         if self.angle != 0:  # use the expensive calculation below only if there is any actual rotation
-            # some rotation is happening, offset calculation is required
-            img_w, img_h = image.get_size()
-
-            bounding_box = [
-                Vector2(0, 0),  # top left
-                Vector2(img_w, 0),  # top right
-                Vector2(img_w, -img_h),  # bottom right
-                Vector2(0, -img_h)  # bottom left
-            ]
-
-            # rotate all vectors to match our rotation
-            bounding_box = [vec.rotate(self.angle) for vec in bounding_box]
-
-            # get smallest x value in all points' x values
-            min_x = min(bounding_box, key=lambda vec: vec[0])[0]
-
-            # get largest y value in all points' y values
-            max_y = max(bounding_box, key=lambda vec: vec[1])[1]
-
-            # get center of image
-            center = Vector2(
-                (img_w * 0.5),  # TODO: center offset, also do globalRect
-                -(img_h * 0.5)  # pygame vectors are upside down, so this is negative
-            )
-            # how much should be corrected from the rotation
-            pivot_offset = center.rotate(self.angle) - center
+            # round the angle to a whole degree, so there are at most 360 rotations to cache
+            angle = round(self.angle) % 360
 
+            # rotated image & drawing offsets, shared with every other object drawing the same image
+            img, offset_x, offset_y = self.parent.get_rotated(image, angle)
             pos = (  # apply the offsets
-                self.x + min_x - pivot_offset[0],
-                self.y - max_y + pivot_offset[1]
+                self.x + offset_x,
+                self.y + offset_y
             )
-
-            img = pygame.transform.rotate(image, self.angle)  # rotate image
         else:
-            # the angle is 0, forget all of the expensive calculations above
+            # the angle is 0, no rotation needed
             img = image
             pos = (self.x, self.y)
 
-        self.rect = img.get_rect()  # update internal rectangle
+        # update internal rectangle in place, rather than allocating a new one every frame
+        self.rect.size = img.get_size()
         # re-calculate global rectangle, mindful of offset and new size
-        self.globalRect = pygame.Rect(
-            pos[0], pos[1],
-            self.rect.w, self.rect.h
-        )
+        self.globalRect.topleft = (int(pos[0]), int(pos[1]))  # truncate like the Rect constructor does
+        self.globalRect.size = self.rect.size
 
         surface.blit(img, pos)  # draw to the screen at the proper position
 
@@ -1587,6 +1782,11 @@ class Player(GameObject):
         self.speed = 5  # speed of the player, used in update()
         self.turnspeed = 6
 
+        # angle the heading below was last calculated for, the trig is only redone when the angle changes
+        self.cached_angle = None
+        # cosine and sine of the player's heading
+        self.cached_cos_sin = (1.0, 0.0)
+
         # these probes
         self.path_probes = [
             # (30, 20),  # front right
@@ -1623,13 +1823,23 @@ class Player(GameObject):
         """
 
         if self.movement_allowed:  # only run this code if movement is allowed, pointless otherwise
-            # alter angle based on which keys are pressed
-            if self.key_right in self.parent.keys_down:
-                self.angle -= self.turnspeed * self.parent.frame_delta
-            if self.key_left in self.parent.keys_down:
-                self.angle += self.turnspeed * self.parent.frame_delta
-            if self.key_pause in self.parent.keys_down:
-                self.parent.set_paused()
+            # bind the game and what is read from it more than once, instead of looking them up every time
+            parent = self.parent
+            frame_delta = parent.frame_delta
+            keys_down = parent.keys_down
+            tile_grid = parent.tile_grid
+            # turning direction from the pressed keys: 1 for left, -1 for right, 0 for both or neither
+            turn = (self.key_left in keys_down) - (self.key_right in keys_down)
+            if turn:
+                # alter angle based on the turning direction
+                self.angle += turn * self.turnspeed * frame_delta
+            if self.key_pause in keys_down:
+                parent.set_paused()
+            if self.angle != self.cached_angle:
+                # the player has turned, recalculate the heading once for the probes and the movement step
+                heading = math.radians(-self.angle)
+                self.cached_cos_sin = (math.cos(heading), math.sin(heading))
+                self.cached_angle = self.angle
             """
             IF YOU EVER NEED CONTROLLABLE SPEED AGAIN...
             
@@ -1637,13 +1847,12 @@ class Player(GameObject):
                 self.speed -= 0.1
             if self.key_up in self.parent.keys_down:
                 self.speed += 0.1
-                
+            
+            ...and round the speed off every frame again, floating points are annoying
             """
 
-            # round the speed off, floating points are annoying
-            self.speed = round(self.speed, 3)
-            # save time calling the Surface method
-            frame_w, frame_h = self.parent.frame.get_size()
+            # save time looking up the frame size
+            frame_w, frame_h = parent.frame_w, parent.frame_h
             # is the player's speed reduced as a result of getting stuck?
             is_slowed_down = False
 
@@ -1654,7 +1863,7 @@ class Player(GameObject):
 
                 try:
                     # check tile at the probe's location
-                    at_probe = self.parent.tile_grid[cell[1]][cell[0]]
+                    at_probe = tile_grid[cell[1], cell[0]]
                 except IndexError:
                     # that coordinate is out of bounds (eg. probe is clipping out of frame)
                     pass
@@ -1670,19 +1879,20 @@ class Player(GameObject):
             # calculate the true speed based on slowdown, use self.speed if no slowdown
             if is_slowed_down:
                 real_speed = (self.speed / 2)
-                if self.parent.current_power_consumption == self.parent.normal_power_consumption:
-                    self.parent.current_power_consumption = self.parent.slow_power_consumption
+                if parent.current_power_consumption == parent.normal_power_consumption:
+                    parent.current_power_consumption = parent.slow_power_consumption
             else:
                 real_speed = self.speed
-                if self.parent.current_power_consumption == self.parent.slow_power_consumption:
-                    self.parent.current_power_consumption = self.parent.normal_power_consumption
-            self.parent.power_used += int((self.parent.current_power_consumption / TARGET_FRAMERATE) * self.parent.frame_delta)
+                if parent.current_power_consumption == parent.slow_power_consumption:
+                    parent.current_power_consumption = parent.normal_power_consumption
+            parent.power_used += int((parent.current_power_consumption / TARGET_FRAMERATE) * frame_delta)
 
-            real_speed = real_speed * self.parent.frame_delta
+            real_speed = real_speed * frame_delta
 
-            # calculate step movement every frame
-            step_x = math.cos(math.radians(-self.angle)) * real_speed
-            step_y = math.sin(math.radians(-self.angle)) * real_speed
+            # calculate step movement every frame from the cached heading
+            cos_a, sin_a = self.cached_cos_sin
+            step_x = cos_a * real_speed
+            step_y = sin_a * real_speed
 
             # check if movement is valid, and it it is, go for it
             if frame_w > self.globalRect.center[0] + step_x > 0:
@@ -1690,11 +1900,11 @@ class Player(GameObject):
             if frame_h > self.globalRect.center[1] + step_y > 0:
                 self.y += step_y
 
-            self.parent.money += self.parent.current_cost * self.parent.current_power_consumption
-            if self.parent.money >= self.parent.money_limit:
-                self.parent.set_game_over()
+            parent.money += parent.current_cost * parent.current_power_consumption
+            if parent.money >= parent.money_limit:
+                parent.set_game_over()
 
-            self.parent.update_path()
+            parent.update_path()
 
     def offset_point(self, probe: tuple):
         """
@@ -1705,9 +1915,15 @@ class Player(GameObject):
             probe (Tuple(float, float): The offset, local coordinates. Assumes 0,0 is pivot.
 
         Returns:
-            Tuple(Vector2, Tuple(int, int)) : Pair of the screenspace coordinate and cell index.
+            Tuple(Tuple(float, float), Tuple(int, int)) : Pair of the screenspace coordinate and cell index.
         """
-        global_vector = Vector2(probe).rotate(-self.angle) + self.globalRect.center
+        # rotate the probe by the cached heading, then offset it by the player's center
+        cos_a, sin_a = self.cached_cos_sin
+        center_x, center_y = self.globalRect.center
+        global_vector = (
+            probe[0] * cos_a - probe[1] * sin_a + center_x,
+            probe[0] * sin_a + probe[1] * cos_a + center_y
+        )
         cell = cell_from_screenspace(global_vector, self.parent.textures.base_tile_size)
         return global_vector, cell
 
@@ -1726,7 +1942,8 @@ class Enemy(GameObject):
         self.speed = 3.5  # chasing speed, for reference, the player's value is 5
         self.target = None  # the target to chase, this is set after initialization
         # instead of heading for the target's center, where should the enemy head for?
-        self.hunt_offset = (self.rect.centerx, self.rect.centery + 40)
+        self.hunt_offset_x = self.rect.centerx
+        self.hunt_offset_y = self.rect.centery + 40
         # when enemy will try to kick the lawnmower
         self.kick_distance = 40
         # animation frame
@@ -1755,10 +1972,17 @@ class Enemy(GameObject):
         if self.target is not None and not self.kicking:  # skip calculating the movement if there is no set target
             # get mouse pos
             target_x, target_y = self.target.globalRect.center
+            # bind the values used more than once below
+            speed = self.speed
+            offset_x, offset_y = self.hunt_offset_x, self.hunt_offset_y
+
+            # where the enemy's position has to end up for its hunt offset to be on the target
+            goal_x = target_x - offset_x
+            goal_y = target_y - offset_y
 
             # calculate relative to object
-            relative_x = target_x - (self.x + self.hunt_offset[0])
-            relative_y = target_y - (self.y + self.hunt_offset[1])
+            relative_x = goal_x - self.x
+            relative_y = goal_y - self.y
 
             if int(relative_y - 20) > 0:
                 self.draw_priority = 90
@@ -1774,24 +1998,17 @@ class Enemy(GameObject):
             furthest_distance = max(abs(relative_x), abs(relative_y))
 
             if furthest_distance > self.kick_distance - 10:
-                step_dist_x = (relative_x / furthest_distance) * self.speed * self.parent.frame_delta  # horizontal step
-                step_dist_y = (relative_y / furthest_distance) * self.speed * self.parent.frame_delta  # vertical step
-
-                # calculate if the enemy can still move smoothly
-                if abs(int(relative_x)) >= self.speed:
-                    # move one step towards target x
-                    self.x += step_dist_x
-                else:
-                    # the enemy is too close to the player to have a reliable
-                    # step calculation because of framerate, just snap to position
-                    # this runs on the last frame of the movement
-                    self.x = target_x - self.hunt_offset[0]
-
+                step_dist_x = (relative_x / furthest_distance) * speed * self.parent.frame_delta  # horizontal step
+                step_dist_y = (relative_y / furthest_distance) * speed * self.parent.frame_delta  # vertical step
+
+                # move one step towards the target if the enemy can still move smoothly, otherwise it is
+                # too close to the player to have a reliable step calculation because of framerate,
+                # so just snap to position, this runs on the last frame of the movement
+                # distances are compared squared, which is the same as comparing their absolute values
+                speed_squared = speed * speed
+                self.x = self.x + step_dist_x if relative_x * relative_x >= speed_squared else goal_x
                 # same as above, but for vertical movement
-                if abs(int(relative_y)) >= self.speed:
-                    self.y += step_dist_y
-                else:
-                    self.y = target_y - self.hunt_offset[1]
+                self.y = self.y + step_dist_y if relative_y * relative_y >= speed_squared else goal_y
             else:
                 self.kick_charge_seconds_elapsed = 0 # start charge loop
                 self.kicking = True
@@ -1802,8 +2019,8 @@ class Enemy(GameObject):
             else:
                 self.kick_charge_seconds_elapsed = -1
 
-                relative_x = self.target.globalRect.centerx - (self.x + self.hunt_offset[0])
-                relative_y = self.target.globalRect.centery - (self.y + self.hunt_offset[1])
+                relative_x = self.target.globalRect.centerx - (self.x + self.hunt_offset_x)
+                relative_y = self.target.globalRect.centery - (self.y + self.hunt_offset_y)
 
                 if max(abs(relative_x), abs(relative_y)) <= self.kick_distance * 2:
                     self.parent.kick_player()
@@ -1826,8 +2043,9 @@ class Enemy(GameObject):
             self.image = self.parent.textures.enemy_kick[1]
 
         if not self.horizontal_flip:
+            # draw the pre-flipped copy of the current image
             super(Enemy, self).draw(
-                *args, image=pygame.transform.flip(self.image, True, False)
+                *args, image=self.parent.textures.enemy_flipped[self.image]
             )
             return
         super(Enemy, self).draw(*args)
@@ -1838,14 +2056,15 @@ class Powerup(GameObject):
         super(Powerup, self).__init__(*args, **kwargs)
         self.start_y = self.y
         self.type = 0
-        self.active = True
 
     def update(self):
         if self.active:
             self.y = self.start_y + (math.sin(self.parent.frames_since_game_start/10)*3)
             px, py = self.parent.player.globalRect.center
 
-            dist_sq = abs((self.globalRect.centerx - px)) ** 2 + abs((self.globalRect.centery - py)) ** 2
+            dx = self.globalRect.centerx - px
+            dy = self.globalRect.centery - py
+            dist_sq = dx * dx + dy * dy  # squaring makes the sign irrelevant, no abs() needed
 
             if dist_sq <= 1024:  # 32^2
                 self.trigger()
@@ -1863,7 +2082,7 @@ class Powerup(GameObject):
             self.parent.current_cost = self.parent.powered_up_cost
             self.parent.player.active_powerups[1] = (0, 5)
         if self.type == 2:
-            self.parent.objects[1].stunned = True
+            self.parent.enemy.stunned = True
             self.parent.player.active_powerups[2] = (0, 5)
 
 
@@ -1927,7 +2146,7 @@ class Button(GameObject):
         # force copy of image here by scaling to exact same size
         image = pygame.transform.scale(self.image, self.image.get_size())
 
-        text_surface = self.parent.fonts.arcade_25.render(self.text, False, self.font_color)
+        text_surface = render_text(self.parent.fonts.arcade_25, self.text, self.font_color)
         tx = (self.rect.w * 0.5) - (text_surface.get_width() * 0.5)
         ty = (self.rect.h * 0.5) - (text_surface.get_height() * 0.5)
 
@@ -1942,9 +2161,15 @@ class Button(GameObject):
 
 if __name__ == '__main__':
     # this runs only when the file is the main one
+    # dump a traceback if the interpreter itself crashes, costs nothing until then
+    faulthandler.enable()
     if USE_ADVANCED_LOGGING:
         # set up advanced logging with levels & debug filtering
-        _logger = logging.Logger('game')  # initialize logger object
+        # records don't need thread or process information, skip gathering it on every log call
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        _logger = logging.getLogger('game')  # get the logger object through the logging manager
         _logger.setLevel(logging.DEBUG if ADVANCED_LOGGING_SHOW_DEBUG else logging.INFO)  # set debug filter
 
         _stdhandler = logging.StreamHandler()  # create handler object to pipe to console